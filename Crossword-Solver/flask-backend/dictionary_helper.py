@@ -1,12 +1,73 @@
 import json
 import os
+import glob
+import hashlib
+import pickle
 import logging
 import random
-from typing import List, Dict, Optional
+import re
+import sys
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
+from itertools import chain
+from typing import Iterable, List, Dict, Optional, Tuple
 from collections import defaultdict
 
+import numpy as np
+
+try:
+    # orjson is an optional speedup for parsing the dictionary files
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+_DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.dictionary-cache')
+
 logger = logging.getLogger(__name__)
 
+# A pattern position is a letter, '.' or a letter class such as [AEIOU]
+_PATTERN_TOKEN = re.compile(r'\[[A-Z]+\]|.')
+
+class WordStore:
+    # Struct-of-arrays word storage: entry word_id lives at the same index in every column.
+    # Definitions are not kept; sources[word_id] names the file to re-read them from.
+    __slots__ = ('words', 'scores', 'lengths', 'clues', 'clues_lower', 'sources')
+    
+    def __init__(self):
+        self.words = []
+        self.scores = array('i')
+        self.lengths = array('b')
+        self.clues = []
+        self.clues_lower = []
+        self.sources = array('H')
+        
+    def __len__(self) -> int:
+        return len(self.words)
+        
+    def append(self, word: str, clue: str, score: int, source: int) -> int:
+        self.words.append(word)
+        self.scores.append(score)
+        self.lengths.append(len(word))
+        # Many words share a clue; interning stores each distinct clue (and its
+        # lowercase form, which is the clue itself when already lowercase) once
+        clue = sys.intern(clue)
+        self.clues.append(clue)
+        self.clues_lower.append(sys.intern(clue.lower()))
+        self.sources.append(source)
+        return len(self.words) - 1
+        
+    def record(self, word_id: int) -> Dict:
+        return {
+            'word': self.words[word_id],
+            'clue': self.clues[word_id],
+            'length': self.lengths[word_id],
+            'score': self.scores[word_id]
+        }
+        
+    def records(self, word_ids) -> List[Dict]:
+        return [self.record(word_id) for word_id in word_ids]
+
 class DictionaryHelper:
     LETTER_SCORES = {
         'A': 1, 'B': 3, 'C': 3, 'D': 2, 'E': 1, 'F': 4, 'G': 2, 'H': 4, 'I': 1,
@@ -20,54 +81,161 @@ class DictionaryHelper:
         'S': 6.3, 'T': 9.1, 'U': 2.8, 'V': 0.98, 'W': 2.4, 'X': 0.15, 'Y': 2.0, 'Z': 0.074
     }
     
-    def __init__(self, dictionary_path: str):
+    VOWELS = frozenset('AEIOU')
+    
+    # Lookup tables derived once from the dicts above for the scoring hot path
+    _LETTER_SCORES_ARR = array('i', map(LETTER_SCORES.get, map(chr, range(128)), [0] * 128))
+    _VOWEL_BYTES = ''.join(sorted(VOWELS)).encode('ascii')
+    _RARE_BONUS = {char: int(max(1, 10 - freq * 0.5)) for char, freq in LETTER_FREQUENCY.items()}
+    _DEFAULT_RARE_BONUS = int(max(1, 10 - 5 * 0.5))
+    
+    # Bump whenever the indexed layout changes so stale caches are ignored
+    _CACHE_VERSION = 7
+    _CACHED_ATTRS = ('store', 'source_files', 'ids_by_length', 'ids_by_first_letter', 'word_ids', 'word_id_by_clue',
+                     'sorted_ids_by_length', 'letters_by_length')
+    
+    def __init__(self, dictionary_path: str, cache_dir: str = None):
         self.dictionary_path = dictionary_path
-        self.words_by_length = defaultdict(list)
-        self.words_by_first_letter = defaultdict(list)
-        self.word_count_by_length = defaultdict(int)
-        self.all_words = []
-        self.word_to_data = {}
+        # Index caches live apart from the dictionary data; DICTIONARY_CACHE_DIR overrides the default
+        self.cache_dir = cache_dir or os.environ.get('DICTIONARY_CACHE_DIR') or _DEFAULT_CACHE_DIR
+        self.store = WordStore()
+        self.source_files = []
+        # Word ids grouped by length and by first letter, in load order
+        self.ids_by_length = defaultdict(list)
+        self.ids_by_first_letter = defaultdict(list)
+        self.word_ids = {}
+        # Lowercased clue -> id of the first word with that clue
+        self.word_id_by_clue = {}
+        # The length buckets again, sorted alphabetically, for prefix lookups
+        self.sorted_ids_by_length = {}
+        # letters_by_length[length][row, i] -> code point of letter i of the word at sorted_ids_by_length[length][row]
+        self.letters_by_length = {}
+        # Solves and interactive searches repeat the same clue queries; results are cached as
+        # word ids per normalised query so callers still get fresh dicts they may modify
+        self._possible_word_ids = lru_cache(maxsize=4096)(self._find_possible_word_ids)
+        self._slot_word_ids = lru_cache(maxsize=4096)(self._find_slot_word_ids)
+        self._pattern_word_ids = lru_cache(maxsize=4096)(self._find_pattern_word_ids)
+        self._length_rankings = lru_cache(maxsize=64)(self._rank_length_bucket)
         self._load_dictionary()
         
     def _load_dictionary(self):
         logger.info("Loading dictionary...")
         
-        for filename in os.listdir(self.dictionary_path):
-            if filename.endswith('.json'):
-                file_path = os.path.join(self.dictionary_path, filename)
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        
-                        for word_key, word_data in data.items():
-                            word = word_data.get('word', word_key).upper()
-                            
-                            if ' ' in word or not self._is_valid_crossword_word(word):
-                                continue
-                                
-                            length = len(word)
-                            
-                            standardized_data = {
-                                'word': word,
-                                'clue': self._extract_clue(word_data),
-                                'definition': self._extract_definition(word_data),
-                                'length': length,
-                                'score': self._calculate_word_score(word)
-                            }
-                            
-                            self.words_by_length[length].append(standardized_data)
-                            if word:
-                                self.words_by_first_letter[word[0]].append(standardized_data)
-                            self.word_count_by_length[length] += 1
-                            self.all_words.append(standardized_data)
-                            self.word_to_data[word] = standardized_data
-                            
-                except Exception as e:
-                    logger.error(f"Error loading dictionary file {filename}: {e}")
-        
-        logger.info(f"Dictionary loaded: {len(self.all_words)} valid crossword words")
-        
-    def _is_valid_crossword_word(self, word: str) -> bool:
+        files = self._scan_dictionary_files()
+        cache_path = self._cache_path(files)
+        if self._load_cache(cache_path):
+            logger.info(f"Dictionary loaded from cache: {len(self.store)} valid crossword words")
+            return
+        
+        for file, entries in zip(files, self._parse_dictionary_files(files)):
+            source = len(self.source_files)
+            self.source_files.append(file.name)
+            for word, clue, score in entries:
+                word_id = self.store.append(word, clue, score, source)
+                
+                self.ids_by_length[len(word)].append(word_id)
+                self.ids_by_first_letter[word[0]].append(word_id)
+                self.word_ids[word] = word_id
+                self.word_id_by_clue.setdefault(self.store.clues_lower[word_id], word_id)
+        
+        self._build_pattern_index()
+        self._save_cache(cache_path)
+        
+        logger.info(f"Dictionary loaded: {len(self.store)} valid crossword words")
+        
+    def _scan_dictionary_files(self) -> List[os.DirEntry]:
+        # DirEntry carries the path and (on Windows, for free) the stat used by the cache signature
+        with os.scandir(self.dictionary_path) as entries:
+            return [entry for entry in entries if entry.name.endswith('.json') and entry.is_file()]
+        
+    def _parse_dictionary_files(self, files: List[os.DirEntry]) -> List[List[Tuple[str, str, int]]]:
+        results = []
+        for file in files:
+            try:
+                results.append(self._parse_dictionary_file(file.path))
+            except Exception as e:
+                logger.error(f"Error loading dictionary file {file.name}: {e}")
+                results.append([])
+        return results
+    
+    @classmethod
+    def _parse_dictionary_file(cls, file_path: str) -> List[Tuple[str, str, int]]:
+        with open(file_path, 'rb') as f:
+            data = _json_loads(f.read())
+        
+        entries = []
+        for word_key, word_data in data.items():
+            word = word_data.get('word', word_key).upper()
+            
+            if ' ' in word or not cls._is_valid_crossword_word(word):
+                continue
+                
+            entries.append((word, cls._extract_clue(word_data), cls._calculate_word_score(word)))
+        return entries
+        
+    def _cache_path(self, files: List[os.DirEntry]) -> str:
+        sources = []
+        for file in sorted(files, key=lambda file: file.name):
+            stat = file.stat()
+            sources.append((file.name, stat.st_mtime_ns, stat.st_size))
+        signature = hashlib.sha1(repr((self._CACHE_VERSION, sources)).encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{self._cache_prefix()}-{signature}.pkl")
+    
+    def _cache_prefix(self) -> str:
+        # One prefix per dictionary directory, so a shared cache dir keeps each one's cache apart
+        return "dictionary-" + hashlib.sha1(os.path.abspath(self.dictionary_path).encode()).hexdigest()[:12]
+    
+    def _load_cache(self, cache_path: str) -> bool:
+        if not os.path.exists(cache_path):
+            return False
+        try:
+            with open(cache_path, 'rb') as f:
+                state = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable dictionary cache {cache_path}: {e}")
+            return False
+        if not isinstance(state, dict) or any(attr not in state for attr in self._CACHED_ATTRS):
+            logger.warning(f"Ignoring incomplete dictionary cache {cache_path}")
+            return False
+        for attr in self._CACHED_ATTRS:
+            setattr(self, attr, state[attr])
+        return True
+    
+    def _save_cache(self, cache_path: str):
+        state = {attr: getattr(self, attr) for attr in self._CACHED_ATTRS}
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            for stale_path in glob.glob(os.path.join(glob.escape(self.cache_dir), f"{self._cache_prefix()}-*.pkl")):
+                os.remove(stale_path)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write dictionary cache {cache_path}: {e}")
+        
+    def _build_pattern_index(self):
+        words = self.store.words
+        # Sorted buckets act as an implicit trie: every prefix maps to a contiguous position range
+        for length, ids in list(self.ids_by_length.items()):
+            self.ids_by_length[length] = array('i', ids)
+            sorted_ids = array('i', sorted(ids, key=words.__getitem__))
+            self.sorted_ids_by_length[length] = sorted_ids
+            packed = ''.join(map(words.__getitem__, sorted_ids)).encode('utf-32-le')
+            self.letters_by_length[length] = np.frombuffer(packed, dtype='<u4').reshape(len(ids), length)
+        for letter, ids in list(self.ids_by_first_letter.items()):
+            self.ids_by_first_letter[letter] = array('i', ids)
+    
+    def _prefix_range(self, ids: array, prefix: str) -> Tuple[int, int]:
+        if not prefix:
+            return 0, len(ids)
+        key = self.store.words.__getitem__
+        lo = bisect_left(ids, prefix, key=key)
+        hi = bisect_left(ids, prefix + '\U0010ffff', lo, key=key)
+        return lo, hi
+        
+    @staticmethod
+    def _is_valid_crossword_word(word: str) -> bool:
         if not word.isalpha():
             return False
             
@@ -76,29 +244,25 @@ class DictionaryHelper:
             
         return True
         
-    def _calculate_word_score(self, word: str) -> int:
-        score = 0
-        vowels = {'A', 'E', 'I', 'O', 'U'}
+    @staticmethod
+    def _calculate_word_score(word: str) -> int:
         word_upper = word.upper()
+        cls = DictionaryHelper
         
-        for char in word_upper:
-            score += self.LETTER_SCORES.get(char, 0)
+        # Non-ASCII letters carry no letter score or vowel bonus, same as LETTER_SCORES.get(char, 0)
+        score = sum(map(cls._LETTER_SCORES_ARR.__getitem__, word_upper.encode('ascii', 'ignore')))
+        interior = word_upper[1:-1].encode('ascii', 'ignore')
+        score += 2 * (len(interior) - len(interior.translate(None, cls._VOWEL_BYTES)))
         
-        for i in range(1, len(word)-1):
-            if word_upper[i] in vowels:
-                score += 2
-        
-        unique_letters = set(word_upper)
-        if len(unique_letters) < len(word)/2:
+        if len(set(word_upper)) < len(word) / 2:
             score -= 3
             
-        first_char = word[0].upper()
-        rare_bonus = max(1, 10 - self.LETTER_FREQUENCY.get(first_char, 5) * 0.5)
-        score += int(rare_bonus)
+        score += cls._RARE_BONUS.get(word_upper[0], cls._DEFAULT_RARE_BONUS)
         
         return max(1, score)
         
-    def _extract_clue(self, word_data: Dict) -> str:
+    @staticmethod
+    def _extract_clue(word_data: Dict) -> str:
         if 'meanings' in word_data and word_data['meanings']:
             first_meaning = word_data['meanings'][0]
             if 'def' in first_meaning:
@@ -106,7 +270,8 @@ class DictionaryHelper:
         
         return f"Definition related to {word_data.get('word', 'unknown')}"
     
-    def _extract_definition(self, word_data: Dict) -> str:
+    @staticmethod
+    def _extract_definition(word_data: Dict) -> str:
         if 'meanings' in word_data:
             definitions = []
             for meaning in word_data['meanings']:
@@ -115,122 +280,203 @@ class DictionaryHelper:
             return "; ".join(definitions)
         
         return f"Definition related to {word_data.get('word', 'unknown')}"
+    
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _read_definitions(file_path: str) -> Dict[str, str]:
+        # Definitions are only needed for single-word lookups, so parse a file on demand
+        with open(file_path, 'rb') as f:
+            data = _json_loads(f.read())
+        return {
+            word_data.get('word', word_key).upper(): DictionaryHelper._extract_definition(word_data)
+            for word_key, word_data in data.items()
+        }
+        
+    def get_definition(self, word: str) -> Optional[str]:
+        word_upper = word.upper()
+        word_id = self.word_ids.get(word_upper)
+        if word_id is None:
+            return None
+        file_path = os.path.join(self.dictionary_path, self.source_files[self.store.sources[word_id]])
+        try:
+            return self._read_definitions(file_path).get(word_upper)
+        except Exception as e:
+            logger.error(f"Error reading definition for {word_upper} from {file_path}: {e}")
+            return None
         
     def get_word_count_by_length(self, length: int) -> int:
-        return self.word_count_by_length.get(length, 0)
+        return len(self.ids_by_length.get(length, ()))
         
     def get_words_by_length(self, length: int, max_words: int = None) -> List[Dict]:
-        words = self.words_by_length.get(length, [])
+        ids = self.ids_by_length.get(length, ())
         
-        if max_words and len(words) > max_words:
-            by_first_letter = defaultdict(list)
-            for word in words:
-                by_first_letter[word['word'][0]].append(word)
+        if max_words and len(ids) > max_words:
+            ranked_by_letter, ranked = self._length_rankings(length)
+            words_per_letter = max(1, max_words // len(ranked_by_letter))
             
-            total_letters = len(by_first_letter)
-            words_per_letter = max(1, max_words // total_letters)
+            selected_ids = []
+            for letter_ids in ranked_by_letter:
+                selected_ids.extend(letter_ids[:words_per_letter])
             
-            selected_words = []
-            for letter, letter_words in by_first_letter.items():
-                letter_words.sort(key=lambda x: x['score'], reverse=True)
-                selected_words.extend(letter_words[:words_per_letter])
-            
-            if len(selected_words) < max_words:
-                remaining = max_words - len(selected_words)
-                all_words_sorted = sorted(words, key=lambda x: x['score'], reverse=True)
-                for word in all_words_sorted:
-                    if word not in selected_words:
-                        selected_words.append(word)
+            if len(selected_ids) < max_words:
+                remaining = max_words - len(selected_ids)
+                selected = set(selected_ids)
+                # The top max_words always hold enough unselected words to fill the gap
+                top_ids = ranked[:max_words]
+                for word_id in top_ids:
+                    if word_id not in selected:
+                        selected_ids.append(word_id)
                         remaining -= 1
                         if remaining <= 0:
                             break
             
-            return selected_words[:max_words]
+            return self.store.records(selected_ids[:max_words])
+        
+        return self.store.records(ids)
         
-        return words
+    def _rank_length_bucket(self, length: int) -> Tuple[List[List[int]], List[int]]:
+        # Word ids of one length by descending score, per first letter (in order of first
+        # appearance) and overall. The sorts are stable, so slicing them matches nlargest on the bucket.
+        ids = self.ids_by_length.get(length, ())
+        words = self.store.words
+        score = self.store.scores.__getitem__
+        by_first_letter = defaultdict(list)
+        for word_id in ids:
+            by_first_letter[words[word_id][0]].append(word_id)
+        
+        ranked_by_letter = [sorted(letter_ids, key=score, reverse=True) for letter_ids in by_first_letter.values()]
+        return ranked_by_letter, sorted(ids, key=score, reverse=True)
         
     def get_words_by_first_letter(self, letter: str, max_words: int = None) -> List[Dict]:
-        words = self.words_by_first_letter.get(letter.upper(), [])
-        return words[:max_words] if max_words else words
+        ids = self.ids_by_first_letter.get(letter.upper(), ())
+        return self.store.records(ids[:max_words] if max_words else ids)
         
     def find_word_by_exact_clue(self, clue: str) -> Optional[Dict]:
-        for word_data in self.all_words:
-            if word_data['clue'].lower() == clue.lower():
-                return word_data
-        return None
+        word_id = self.word_id_by_clue.get(clue.lower())
+        return self.store.record(word_id) if word_id is not None else None
+        
+    def get_possible_words(self, clue: str, max_words: int = 50,
+                           length_range: Optional[Tuple[int, int]] = None) -> List[Dict]:
+        length_range = tuple(length_range) if length_range else None
+        return self.store.records(self._possible_word_ids(clue.lower(), max_words, length_range))
+        
+    def _find_possible_word_ids(self, clue_lower: str, max_words: int,
+                                length_range: Optional[Tuple[int, int]]) -> Tuple[int, ...]:
+        if length_range:
+            min_len, max_len = length_range
+            ids = chain.from_iterable(self.ids_by_length.get(length, ()) for length in range(min_len, max_len + 1))
+        else:
+            ids = range(len(self.store))
+        
+        results = []
+        clues_lower = self.store.clues_lower
+        for word_id in ids:
+            if clue_lower in clues_lower[word_id]:
+                results.append(word_id)
+                if len(results) >= max_words:
+                    break
+        
+        return tuple(results)
+        
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _parse_pattern(pattern: str) -> Tuple[str, Optional[re.Pattern]]:
+        tokens = _PATTERN_TOKEN.findall(pattern)
+        if len(tokens) == len(pattern):
+            return pattern, None
+        # Letter classes are not in the position index: look them up as '.', then confirm with the regex
+        indexed = ''.join(token if len(token) == 1 else '.' for token in tokens)
+        # Only classes and '.' are regex syntax; every other character must match literally
+        regex = ''.join(token if len(token) > 1 or token == '.' else re.escape(token) for token in tokens)
+        return indexed, re.compile(regex)
         
     def get_words_by_pattern(self, pattern: str, clue: str = None, 
                            max_words: int = 50) -> List[Dict]:
+        return self.store.records(self._pattern_word_ids(pattern.upper(), clue.lower() if clue else None, max_words))
+        
+    def _find_pattern_word_ids(self, pattern: str, clue_lower: Optional[str], max_words: int) -> Tuple[int, ...]:
         results = []
+        pattern, letter_classes = self._parse_pattern(pattern)
         pattern_len = len(pattern)
+        sorted_ids = self.sorted_ids_by_length.get(pattern_len)
+        if not sorted_ids:
+            return ()
         
-        candidate_words = self.words_by_length.get(pattern_len, [])
+        # Descend the implicit trie along the fixed prefix, then compare the rest column-wise
+        prefix_len = next((i for i, char in enumerate(pattern) if char == '.'), pattern_len)
+        lo, hi = self._prefix_range(sorted_ids, pattern[:prefix_len])
         
-        for word_data in candidate_words:
-            word = word_data['word'].upper()
-            matches = True
-            
-            for i, char in enumerate(pattern):
-                if char != '.' and char != word[i]:
-                    matches = False
-                    break
-            
-            if matches:
-                if clue and clue.lower() not in word_data['clue'].lower():
-                    continue
-                    
-                results.append(word_data)
-                if len(results) >= max_words:
-                    break
+        candidates = np.frombuffer(sorted_ids, dtype=np.int32)[lo:hi]
+        constraints = [(i, char) for i, char in enumerate(pattern[prefix_len:], prefix_len) if char != '.']
+        if constraints and lo < hi:
+            columns = [i for i, _ in constraints]
+            letters = np.array([ord(char) for _, char in constraints], dtype=np.uint32)
+            candidates = candidates[(self.letters_by_length[pattern_len][lo:hi, columns] == letters).all(axis=1)]
         
-        return results
+        # Matches come back in load order, like every other length-bucket query, so a
+        # truncated result keeps the same words whatever the index order
+        words = self.store.words
+        clues_lower = self.store.clues_lower
+        for word_id in np.sort(candidates).tolist():
+            if letter_classes and not letter_classes.fullmatch(words[word_id]):
+                continue
+            if clue_lower and clue_lower not in clues_lower[word_id]:
+                continue
+                
+            results.append(word_id)
+            if len(results) >= max_words:
+                break
+        
+        return tuple(results)
     
     def get_words_for_crossword_slot(self, clue: str, length: int, max_words: int = 50) -> List[Dict]:
+            return self.store.records(self._slot_word_ids(clue.lower(), length, max_words))
+            
+    def _find_slot_word_ids(self, clue_lower: str, length: int, max_words: int) -> Tuple[int, ...]:
             results = []
-            clue_lower = clue.lower()
-            exact_match = self.find_word_by_exact_clue(clue)
-            if exact_match and len(exact_match['word']) == length:
-                results.append(exact_match)
+            exact_id = self.word_id_by_clue.get(clue_lower)
+            if exact_id is not None and self.store.lengths[exact_id] == length:
+                results.append(exact_id)
             
-            for word_data in self.all_words:
-                if len(word_data['word']) != length:
-                    continue
-                    
-                if (clue_lower in word_data['clue'].lower() or 
-                    word_data['clue'].lower() in clue_lower):
-                    results.append(word_data)
+            ids = self.ids_by_length.get(length, ())
+            clues_lower = self.store.clues_lower
+            for word_id in ids:
+                word_clue = clues_lower[word_id]
+                if clue_lower in word_clue or word_clue in clue_lower:
+                    results.append(word_id)
                     if len(results) >= max_words:
                         break
             
             if not results:
-                first_word = clue.split()[0].lower() if clue.split() else ""
+                first_word = clue_lower.split()[0] if clue_lower.split() else ""
                 if first_word:
-                    for word_data in self.all_words:
-                        if len(word_data['word']) != length:
-                            continue
-                        if first_word in word_data['clue'].lower():
-                            results.append(word_data)
+                    for word_id in ids:
+                        if first_word in clues_lower[word_id]:
+                            results.append(word_id)
                             if len(results) >= max_words:
                                 break
             
-            return results
+            return tuple(results)
 
     def get_clue_for_word(self, word: str) -> Dict:
         word_upper = word.upper()
-        return self.word_to_data.get(word_upper, {
+        word_id = self.word_ids.get(word_upper)
+        if word_id is not None:
+            return self.store.record(word_id)
+        return {
             'word': word_upper, 
             'clue': f"Definition related to {word_upper}",
             'score': self._calculate_word_score(word_upper)
-        })
+        }
+        
+    def get_clues_for_words(self, words: Iterable[str]) -> Dict[str, Dict]:
+        return {word: self.get_clue_for_word(word) for word in set(words)}
         
     def get_random_word(self, length: int = None, max_words: int = None) -> Dict:
         if length:
-            words = self.words_by_length.get(length, [])
-            if max_words:
-                words = words[:max_words]
-            return random.choice(words) if words else None
+            ids = self.ids_by_length.get(length, ())
         else:
-            words = self.all_words
-            if max_words:
-                words = words[:max_words]
-            return random.choice(words) if words else None
\ No newline at end of file
+            ids = range(len(self.store))
+        if max_words:
+            ids = ids[:max_words]
+        return self.store.record(random.choice(ids)) if ids else None
@@ -1,12 +1,96 @@
-from collections import defaultdict
+from bisect import insort
+from collections import defaultdict, deque
+from functools import lru_cache
+from itertools import islice
 import random
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
+import numpy as np
 from dictionary_helper import DictionaryHelper
 
 # Initialize dictionary helper for word lookup and scoring
 dict_helper = DictionaryHelper("dictionary")
 
+# Grid cells hold Latin-1 character codes; '.' marks an empty cell
+EMPTY = ord('.')
+
+@lru_cache(maxsize=4096)
+def _word_bytes(word: str) -> Optional[bytes]:
+    """Latin-1 encoding of a word, or None if it cannot be stored in the grid"""
+    try:
+        return word.encode('latin-1')
+    except UnicodeEncodeError:
+        return None
+
+@lru_cache(maxsize=4096)
+def _word_codes(word: str) -> Optional[np.ndarray]:
+    """Character codes of a word as a uint8 array, or None if it cannot be stored in the grid"""
+    word_bytes = _word_bytes(word)
+    return None if word_bytes is None else np.frombuffer(word_bytes, dtype=np.uint8)
+
+def _fits_cells(cells: bytes, width: int, height: int, word: bytes, vertical: bool, x: int, y: int) -> bool:
+    """
+    Placement check kernel over a row-major snapshot of the grid (grid.tobytes())
+    Scalar byte reads with stride arithmetic; see CrosswordGenerator._fits for the rules
+    """
+    length = len(word)
+    if vertical:
+        if x < 0 or x >= width or y < 0 or y + length > height:
+            return False
+        step, side = width, 1
+        has_before, has_after = x > 0, x < width - 1
+        has_head, has_tail = y > 0, y + length < height
+    else:
+        if y < 0 or y >= height or x < 0 or x + length > width:
+            return False
+        step, side = 1, width
+        has_before, has_after = y > 0, y < height - 1
+        has_head, has_tail = x > 0, x + length < width
+    
+    start = pos = y * width + x
+    # Ends of the word must be open; O(1), so checked before walking the cells
+    if (has_head and cells[start - step] != EMPTY) or (has_tail and cells[start + length * step] != EMPTY):
+        return False
+    
+    connect = False
+    for code in word:
+        existing = cells[pos]
+        if existing != EMPTY:
+            if existing != code:
+                return False  # Character conflict
+            connect = True  # Valid intersection, exempt from the adjacency check
+        elif (has_before and cells[pos - side] != EMPTY) or (has_after and cells[pos + side] != EMPTY):
+            return False
+        pos += step
+    
+    return connect
+
+@lru_cache(maxsize=8192)
+def _open_cells(before: Optional[bytes], after: Optional[bytes]) -> int:
+    """
+    Number of positions along a placement with an empty cell on at least one side
+    before/after are the cells beside the word (None where the side is off the grid)
+    Keyed by the neighbouring cells only, so repeated checks of an unchanged area are free
+    """
+    if before is None:
+        return 0 if after is None else after.count(EMPTY)
+    if after is None:
+        return before.count(EMPTY)
+    return sum(1 for a, b in zip(before, after) if a == EMPTY or b == EMPTY)
+
+@lru_cache(maxsize=16)
+def _word_pool(max_length: int) -> Tuple[Tuple[Dict, ...], ...]:
+    """
+    Dictionary words of the lengths around max_length used for generation, grouped by
+    score from highest to lowest (deterministic, so cached)
+    """
+    by_score = defaultdict(list)
+    for length in range(max(3, max_length-2), min(12, max_length+2)+1):
+        # Get limited number of words per length for diversity
+        for word in dict_helper.get_words_by_length(length, 20):
+            by_score[word['score']].append(word)
+    return tuple(tuple(by_score[score]) for score in sorted(by_score, reverse=True))
+
 @dataclass
 class Point:
     """Represents a coordinate point in the grid"""
@@ -23,21 +107,35 @@ class WordSlot:
     number: int = 0  # Crossword numbering
     word: str = ""   # The actual word
     clue: str = ""   # Clue for the word
+
+@dataclass(slots=True)
+class PuzzleState:
+    """Intermediate puzzle during generation; only the final one becomes a CrosswordGenerator"""
+    grid: np.ndarray                                    # Current word placements
+    empty_grid: np.ndarray                              # Grid as it was after the initial word
+    words: set                                          # Words already placed
+    letter_positions: Dict[int, List[Tuple[int, int]]]  # Filled cells by character code
         
 class CrosswordGenerator:
-    def __init__(self, width=15, height=15, grid=None, words=None):
+    def __init__(self, width=15, height=15, grid=None, words=None, letter_positions=None):
         """Initialize the crossword generator with grid dimensions and empty state"""
         self.width = width
         self.height = height
-        # Main grid showing current word placements
-        self.grid = grid or [['.' for _ in range(width)] for _ in range(height)]
-        # Tracking of original empty state
-        self.empty_grid = [row.copy() for row in self.grid]
+        # Center cell, the reference point for placement scoring
+        self.center_x, self.center_y = width // 2, height // 2
+        # Main grid showing current word placements (height x width uint8 character codes)
+        if grid is None:
+            self.grid = np.full((height, width), EMPTY, dtype=np.uint8)
+        else:
+            self.grid = self._as_array(grid)
+        # Tracking of original empty state, copied from the grid on first use
+        self._empty_grid = None
+        # Filled cells by character code, each list of (y, x) kept in row-major order
+        if letter_positions is None:
+            letter_positions = self._index_letters(self.grid)
+        self.letter_positions = letter_positions
         # Set of words already placed in the puzzle
         self.words = set(words) if words else set()
-        # Cache for word data and scores
-        self.word_cache = {}
-        self.word_scores = {}
         # Track starting letters used for diversity
         self.used_starting_letters = set()
 
@@ -48,16 +146,47 @@ class CrosswordGenerator:
         - Scores and sorts words for better puzzle quality
         - Adds randomness to avoid repetitive patterns
         """
+        # Get words of various lengths around the target max_length, already in score order
+        # (higher scores first); only the order within equal scores is randomized
         words = []
-        # Get words of various lengths around the target max_length
-        for length in range(max(3, max_length-2), min(12, max_length+2)+1):
-            # Get limited number of words per length for diversity
-            words.extend(dict_helper.get_words_by_length(length, 20))
-        
-        # Sort by score (higher scores first) with some randomness
-        words.sort(key=lambda x: (-x['score'], random.random()))
+        for tied in _word_pool(max_length):
+            tied = list(tied)
+            random.shuffle(tied)
+            words.extend(tied)
         return words
 
+    @property
+    def empty_grid(self):
+        """Grid as it was before expansion (grids are never written in place, so a lazy copy matches)"""
+        if self._empty_grid is None:
+            self._empty_grid = self.grid.copy()
+        return self._empty_grid
+
+    @empty_grid.setter
+    def empty_grid(self, grid):
+        self._empty_grid = grid
+
+    def _as_array(self, grid):
+        """Convert a list-of-lists character grid to the uint8 grid representation"""
+        if isinstance(grid, np.ndarray):
+            return grid
+        rows = [''.join(row).encode('latin-1') for row in grid]
+        return np.frombuffer(b''.join(rows), dtype=np.uint8).reshape(len(rows), -1).copy()
+
+    @staticmethod
+    def _index_letters(grid) -> Dict[int, List[Tuple[int, int]]]:
+        """Build the character code -> filled cells index for a grid"""
+        letter_positions = defaultdict(list)
+        ys, xs = np.nonzero(grid != EMPTY)
+        for y, x, code in zip(ys.tolist(), xs.tolist(), grid[ys, xs].tolist()):
+            letter_positions[code].append((y, x))
+        return dict(letter_positions)
+
+    def as_char_grid(self, grid=None) -> List[List[str]]:
+        """Return a grid (default: the puzzle grid) as rows of single-character strings"""
+        grid = self.grid if grid is None else grid
+        return [list(row.tobytes().decode('latin-1')) for row in grid]
+
     def _calculate_word_placement_score(self, word):
         """Calculate score for word placement priority"""
         return dict_helper._calculate_word_score(word)
@@ -75,12 +204,14 @@ class CrosswordGenerator:
             word_list = self.get_optimized_word_list(self.width)
         elif not word_list:
             return None
+        # Words are consumed from the front across expansion passes
+        word_list = deque(word_list)
             
         # Try multiple generation attempts
         for attempt in range(max_attempts):
             # Refresh word list if exhausted
             if not word_list:
-                word_list = self.get_optimized_word_list(self.width)
+                word_list = deque(self.get_optimized_word_list(self.width))
                 
             # Select initial word if not provided
             if initial_word is None:
@@ -108,7 +239,7 @@ class CrosswordGenerator:
                     self.used_starting_letters.add(initial_word[0].lower())
                 
                 # Select new initial word from top candidates
-                initial_word_dict = random.choice(word_list[:min(10, len(word_list))])
+                initial_word_dict = random.choice(list(islice(word_list, 10)))
                 initial_word = initial_word_dict['word']
             else:
                 break
@@ -118,13 +249,22 @@ class CrosswordGenerator:
         
         # Final cleanup and return
         if best_puzzle:
-            for y in range(self.height):
-                for x in range(self.width):
-                    if best_puzzle.empty_grid[y][x] == ' ':
-                        best_puzzle.empty_grid[y][x] = '.'
-            return best_puzzle
+            return self._materialize(best_puzzle)
         return None
 
+    def _materialize(self, state):
+        """Build the CrosswordGenerator returned to callers from a generation state"""
+        puzzle = CrosswordGenerator(
+            width=self.width,
+            height=self.height,
+            grid=state.grid,
+            words=state.words,
+            letter_positions=state.letter_positions
+        )
+        puzzle.empty_grid = state.empty_grid.copy()
+        puzzle.empty_grid[puzzle.empty_grid == ord(' ')] = EMPTY
+        return puzzle
+
     def _select_initial_word(self, word_list):
         """
         Select the first word to place in the puzzle
@@ -133,47 +273,51 @@ class CrosswordGenerator:
         if not word_list:
             return None
             
-        # Prefer words with new starting letters
-        unused_letter_words = [w for w in word_list if w['word'][0].lower() not in self.used_star0ting_letters]
+        # Prefer words with new starting letters; only the first five candidates are needed
+        unused_letter_words = list(islice(
+            (w for w in word_list if w['word'][0].lower() not in self.used_starting_letters), 5
+        ))
         
         if unused_letter_words:
-            return random.choice(unused_letter_words[:min(5, len(unused_letter_words))])['word']
+            return random.choice(unused_letter_words)['word']
         else:
             # Fallback to random selection from top candidates
-            return random.choice(word_list[:10])['word']
+            return random.choice(list(islice(word_list, 10)))['word']
 
     def _place_initial_word(self, word, vertical):
         """
         Place the first word in the center of the grid
-        Returns a new puzzle instance with the initial word placed
+        Returns a new puzzle state with the initial word placed
         """
+        codes = _word_codes(word)
+        if codes is None:  # Word has characters the grid cannot hold
+            return None
         if vertical:
             # Center vertically, checking bounds
             x = self.width // 2
             y = (self.height - len(word)) // 2
             if y < 0:  # Word too long for grid
                 return None
-            new_grid = [row.copy() for row in self.grid]
-            for i, char in enumerate(word):
-                new_grid[y + i][x] = char
+            new_grid = self.grid.copy()
+            new_grid[y:y + len(word), x] = codes
         else:
             # Center horizontally, checking bounds
             x = (self.width - len(word)) // 2
             y = self.height // 2
             if x < 0:  # Word too long for grid
                 return None
-            new_grid = [row.copy() for row in self.grid]
-            for i, char in enumerate(word):
-                new_grid[y][x + i] = char
+            new_grid = self.grid.copy()
+            new_grid[y, x:x + len(word)] = codes
 
         new_words = {word}
-        new_empty_grid = [['.' for _ in range(self.width)] for _ in range(self.height)]
         
-        return CrosswordGenerator(
-            width=self.width,
-            height=self.height,
+        # The grid after the initial word is also the puzzle's empty_grid; grids are
+        # replaced rather than written during generation, so one array serves both
+        return PuzzleState(
             grid=new_grid,
-            words=new_words
+            empty_grid=new_grid,
+            words=new_words,
+            letter_positions=self._index_letters(new_grid)
         )
 
     def _generate_and_finalize(self, puzzle, word_list, max_attempts=100):
@@ -201,20 +345,18 @@ class CrosswordGenerator:
         Iteratively adds words to the puzzle using best-fit approach
         Uses placement scoring to prioritize high-quality placements
         """
-        tried_words = []  # Words that couldn't be placed
         current_puzzle = puzzle
         
         for attempt in range(max_attempts):
-            # Exit if no words left to try
-            if not word_list and not tried_words:
-                break
-                
-            # Refresh word list from tried words if needed
+            # Exit if no words left to try. Words that failed are not retried: they
+            # failed against the current puzzle, and only a success changes it
+            # (any success also discards the failures before it), so the puzzle
+            # has reached its fixed point for this word list
             if not word_list:
-                word_list, tried_words = tried_words, []
+                break
                 
             # Get next word to try
-            word_dict = word_list.pop(0)
+            word_dict = word_list.popleft()
             word_str = word_dict['word']
             
             # Skip if word already used
@@ -222,86 +364,88 @@ class CrosswordGenerator:
                 continue
                 
             # Find all possible placements for this word
-            options = self._get_best_word_placements(current_puzzle, word_dict)
-            if options:
-                # Choose the placement with highest potential
-                best_option = max(options, key=lambda opt: opt['potential'])
-                current_puzzle = best_option['puzzle']
-                tried_words = []  # Reset tried words on success
-            else:
-                # Word couldn't be placed, save for later
-                tried_words.append(word_dict)
+            best_placement = self._get_best_word_placements(current_puzzle, word_dict)
+            if best_placement:
+                x, y, vertical = best_placement
+                current_puzzle = self._copy_with_word(current_puzzle, x, y, vertical, word_str)
         
         return current_puzzle
 
     def _get_best_word_placements(self, puzzle, word_dict):
         """
         Find all valid placements for a word and score them
-        Returns list of placement options with their potential scores
+        Returns the (first) placement with highest potential as (x, y, vertical), or None;
+        nothing is copied here
+        The word's own score is the same for every placement, so it is left out of the potentials
         """
         word = word_dict['word']
-        options = []
+        best_placement = None
+        best_potential = None
+        word_bytes = _word_bytes(word)
+        if word_bytes is None or ' ' in word:
+            return best_placement
+        # One snapshot of the grid serves every fits check for this word
+        cells = puzzle.grid.tobytes()
+        width, height = self.width, self.height
+        # Origins must leave room for the whole word; anything else is rejected before the kernel
+        last_x, last_y = width - len(word_bytes), height - len(word_bytes)
+        positions = puzzle.letter_positions
+        fits = _fits_cells
+        placement_potential = self._calculate_placement_potential
         
-        # Look for matching characters in existing puzzle
-        for i, char in enumerate(word):
-            for y in range(self.height):
-                for x in range(self.width):
-                    if puzzle.grid[y][x] == char:
-                        # Try horizontal placement
-                        h_fits = self._fits(puzzle, word, False, x-i, y)
-                        if h_fits:
-                            new_puzzle = self._copy_with_word(puzzle, x-i, y, False, word)
-                            potential = self._calculate_placement_potential(new_puzzle, x-i, y, False, word)
-                            options.append({
-                                'puzzle': new_puzzle,
-                                'potential': potential + word_dict['score']
-                            })
-                        
-                        # Try vertical placement
-                        v_fits = self._fits(puzzle, word, True, x, y-i)
-                        if v_fits:
-                            new_puzzle = self._copy_with_word(puzzle, x, y-i, True, word)
-                            potential = self._calculate_placement_potential(new_puzzle, x, y-i, True, word)
-                            options.append({
-                                'puzzle': new_puzzle,
-                                'potential': potential + word_dict['score']
-                            })
+        # Look for matching characters in existing puzzle (row-major, like a cell-by-cell scan)
+        for i, code in enumerate(word_bytes):
+            for y, x in positions.get(code, ()):
+                # Try horizontal placement
+                h_fits = 0 <= x-i <= last_x and fits(cells, width, height, word_bytes, False, x-i, y)
+                if h_fits:
+                    potential = placement_potential(puzzle, x-i, y, False, word, cells)
+                    if best_potential is None or potential > best_potential:
+                        best_potential, best_placement = potential, (x-i, y, False)
+                
+                # Try vertical placement
+                v_fits = 0 <= y-i <= last_y and fits(cells, width, height, word_bytes, True, x, y-i)
+                if v_fits:
+                    potential = placement_potential(puzzle, x, y-i, True, word, cells)
+                    if best_potential is None or potential > best_potential:
+                        best_potential, best_placement = potential, (x, y-i, True)
         
-        return options
+        return best_placement
 
-    def _calculate_placement_potential(self, puzzle, x, y, vertical, word):
+    def _calculate_placement_potential(self, puzzle, x, y, vertical, word, cells=None):
         """
         Score a potential word placement based on:
         - Adjacent empty cells (future expansion potential)
         - Distance from center (prefer central placements)
         - Connections to existing words
+        Evaluated against the puzzle before the word is placed; placing a word
+        never changes the cells beside it, so no copy of the grid is needed
+        cells is an optional grid.tobytes() snapshot shared by the caller
         """
         potential = 0
+        if cells is None:
+            cells = puzzle.grid.tobytes()
+        width = self.width
+        length = len(word)
         
-        # Check adjacent empty cells for expansion potential
+        # Check adjacent empty cells for expansion potential (strided slices of the snapshot)
         if vertical:
-            for i in range(len(word)):
-                curr_x, curr_y = x, y + i
-                if (curr_x > 0 and puzzle.grid[curr_y][curr_x-1] == '.') or \
-                   (curr_x < self.width-1 and puzzle.grid[curr_y][curr_x+1] == '.'):
-                    potential += 1
+            start, stop = y * width + x, (y + length) * width + x
+            before = cells[start - 1:stop - 1:width] if x > 0 else None
+            after = cells[start + 1:stop + 1:width] if x < width - 1 else None
         else:
-            for i in range(len(word)):
-                curr_x, curr_y = x + i, y
-                if (curr_y > 0 and puzzle.grid[curr_y-1][curr_x] == '.') or \
-                   (curr_y < self.height-1 and puzzle.grid[curr_y+1][curr_x] == '.'):
-                    potential += 1
+            start = y * width + x
+            before = cells[start - width:start - width + length] if y > 0 else None
+            after = cells[start + width:start + width + length] if y < self.height - 1 else None
+        potential += _open_cells(before, after)
         
         # Prefer placements closer to center
-        center_x, center_y = self.width // 2, self.height // 2
-        distance = abs(x - center_x) + abs(y - center_y)
+        distance = abs(x - self.center_x) + abs(y - self.center_y)
         potential += max(0, 10 - distance) // 2
         
-        # Reward connections to existing words
-        connections = sum(
-            1 for char in word 
-            if char in {c for row in puzzle.grid for c in row if c != '.'}
-        )
+        # Reward connections to existing words; scored as on the grid with the
+        # word placed, where every letter of the word is among the placed letters
+        connections = length
         potential += connections * 2
         
         return potential
@@ -318,147 +462,121 @@ class CrosswordGenerator:
         """
         if ' ' in word:
             return False
-        
-        connect = False  # Track if word connects to existing words
-        for i in range(len(word)):
-            # Calculate current position in grid
-            if vertical:
-                loc_x, loc_y = x, y + i
-            else:
-                loc_x, loc_y = x + i, y
-                
-            # Check grid boundaries
-            if loc_x < 0 or loc_x >= self.width or loc_y < 0 or loc_y >= self.height:
-                return False
-                
-            existing_char = puzzle.grid[loc_y][loc_x]
-            
-            # Handle character conflicts and intersections
-            if existing_char != '.':
-                if existing_char == word[i]:
-                    connect = True  # Valid intersection found
-                    continue  # Skip adjacent checks for intersection points
-                else:
-                    return False  # Character conflict
-                    
-            # Check adjacent cells in perpendicular direction
-            if vertical:
-                if (loc_x > 0 and puzzle.grid[loc_y][loc_x-1] != '.') or \
-                (loc_x < self.width-1 and puzzle.grid[loc_y][loc_x+1] != '.'):
-                    return False
-            else:
-                if (loc_y > 0 and puzzle.grid[loc_y-1][loc_x] != '.') or \
-                (loc_y < self.height-1 and puzzle.grid[loc_y+1][loc_x] != '.'):
-                    return False
-                        
-        # Must connect to existing words (except first word)
-        if not connect:
+        word_bytes = _word_bytes(word)
+        if word_bytes is None:
             return False
-            
-        # Check ends of word for proper spacing
-        if vertical:
-            if (y > 0 and puzzle.grid[y-1][x] != '.') or \
-            (y + len(word) < self.height and puzzle.grid[y + len(word)][x] != '.'):
-                return False
-        else:
-            if (x > 0 and puzzle.grid[y][x-1] != '.') or \
-            (x + len(word) < self.width and puzzle.grid[y][x + len(word)] != '.'):
-                return False
-                
-        return True
+        return _fits_cells(puzzle.grid.tobytes(), self.width, self.height, word_bytes, vertical, x, y)
 
     def _copy_with_word(self, puzzle, x, y, vertical, word):
         """
-        Create a new puzzle instance with the given word added
-        Returns a deep copy with updated grid and word set
+        Create a new puzzle state with the given word added
+        Copies the grid and word set; the empty grid is never modified during generation and is shared
         """
-        new_grid = [row.copy() for row in puzzle.grid]
-        new_empty_grid = [row.copy() for row in puzzle.empty_grid]
+        new_grid = puzzle.grid.copy()
         
-        # Place word in grid
+        # Place word in grid, keeping the cells it covers as they were before
+        codes = _word_codes(word)
         if vertical:
-            for i, char in enumerate(word):
-                new_grid[y + i][x] = char
-                if new_empty_grid[y + i][x] == '.':
-                    new_empty_grid[y + i][x] = '.' 
+            line = new_grid[y:y + len(codes), x]
         else:
-            for i, char in enumerate(word):
-                new_grid[y][x + i] = char
-                if new_empty_grid[y][x + i] == '.':
-                    new_empty_grid[y][x + i] = '.'
+            line = new_grid[y, x:x + len(codes)]
+        previous = line.tobytes()
+        line[:] = codes
+        
+        # Index the newly filled cells, copying only the position lists that change
+        letter_positions = dict(puzzle.letter_positions)
+        copied = set()
+        for i, code in enumerate(_word_bytes(word)):
+            if previous[i] != EMPTY:
+                continue  # Intersection, already indexed
+            cell = (y + i, x) if vertical else (y, x + i)
+            if code not in copied:
+                letter_positions[code] = list(letter_positions.get(code, ()))
+                copied.add(code)
+            insort(letter_positions[code], cell)
         
         # Update word set
         new_words = set(puzzle.words)
         new_words.add(word if isinstance(word, str) else word['word'])
 
-        # Create new puzzle instance
-        new_puzzle = CrosswordGenerator(
-            width=self.width,
-            height=self.height,
+        return PuzzleState(
             grid=new_grid,
-            words=new_words
+            empty_grid=puzzle.empty_grid,
+            words=new_words,
+            letter_positions=letter_positions
         )
-        new_puzzle.empty_grid = new_empty_grid
-        return new_puzzle
 
     # POST-GENERATION ANALYSIS METHODS
 
+    @staticmethod
+    def _filled_neighbours(filled):
+        """Masks of cells whose left, right, upper and lower neighbours are filled"""
+        has_left = np.zeros_like(filled)
+        has_left[:, 1:] = filled[:, :-1]
+        has_right = np.zeros_like(filled)
+        has_right[:, :-1] = filled[:, 1:]
+        has_up = np.zeros_like(filled)
+        has_up[1:, :] = filled[:-1, :]
+        has_down = np.zeros_like(filled)
+        has_down[:-1, :] = filled[1:, :]
+        return has_left, has_right, has_up, has_down
+
+    @staticmethod
+    def _run_lengths(filled):
+        """Number of filled cells from each cell rightwards and downwards, up to the next empty cell"""
+        height, width = filled.shape
+        cols = np.arange(width)
+        rows = np.arange(height)[:, None]
+        # Index of the next empty cell at or after each cell (the edge if none)
+        next_across = np.minimum.accumulate(np.where(filled, width, cols)[:, ::-1], axis=1)[:, ::-1]
+        next_down = np.minimum.accumulate(np.where(filled, height, rows)[::-1], axis=0)[::-1]
+        return next_across - cols, next_down - rows
+
     def analyze_grid(self, for_empty_grid=False) -> Tuple[List[WordSlot], List[WordSlot]]:
         """
         Analyze the completed grid to identify all word positions
         Returns across and down word slots with proper numbering
         """
         grid_to_use = self.empty_grid if for_empty_grid else self.grid
-        numbered_cells = {}
-        number = 1
+        
+        # Number the starting cells of the analyzed grid in row-major order
+        filled = grid_to_use != EMPTY
+        has_left, has_right, has_up, has_down = self._filled_neighbours(filled)
+        starts = filled & ((~has_left & has_right) | (~has_up & has_down))
+        numbers = np.cumsum(starts).reshape(starts.shape)
+        
+        # Words are read from the puzzle grid: a numbered cell yields a word in each
+        # direction where the puzzle has no letter before it and one after it
+        filled = self.grid != EMPTY
+        has_left, has_right, has_up, has_down = self._filled_neighbours(filled)
+        run_across, run_down = self._run_lengths(filled)
+        cells = self.grid.tobytes()
+        cells_t = self.grid.T.tobytes()
+        
         across = []
-        down = []
+        for y, x in zip(*(a.tolist() for a in np.nonzero(starts & ~has_left & has_right))):
+            length = int(run_across[y, x])
+            start = y * self.width + x
+            word = cells[start:start + length].decode('latin-1')
+            across.append(WordSlot(
+                x=x, y=y, length=length, direction='across',
+                number=int(numbers[y, x]), word=word
+            ))
         
-        # First pass: Number the starting cells
-        for y in range(self.height):
-            for x in range(self.width):
-                if grid_to_use[y][x] == '.':
-                    continue
-                    
-                # Check if this cell starts an across word
-                is_across = (x == 0 or grid_to_use[y][x-1] == '.') and (x < self.width-1 and grid_to_use[y][x+1] != '.')
-                # Check if this cell starts a down word
-                is_down = (y == 0 or grid_to_use[y-1][x] == '.') and (y < self.height-1 and grid_to_use[y+1][x] != '.')
-                
-                if is_across or is_down:
-                    if (x, y) not in numbered_cells:
-                        numbered_cells[(x, y)] = number
-                        number += 1
+        down = []
+        for y, x in zip(*(a.tolist() for a in np.nonzero(starts & ~has_up & has_down))):
+            length = int(run_down[y, x])
+            start = x * self.height + y
+            word = cells_t[start:start + length].decode('latin-1')
+            down.append(WordSlot(
+                x=x, y=y, length=length, direction='down',
+                number=int(numbers[y, x]), word=word
+            ))
         
-        # Second pass: Extract complete words
-        for (x, y), num in numbered_cells.items():
-            # Extract across words
-            if x == 0 or self.grid[y][x-1] == '.':
-                length = 0
-                while x + length < self.width and self.grid[y][x+length] != '.':
-                    length += 1
-                if length > 1:  # Only words of 2+ letters
-                    word = ''.join(self.grid[y][x+i] for i in range(length))
-                    clue_data = dict_helper.get_clue_for_word(word)
-                    clue = clue_data.get('clue', f"Definition related to {word}")
-                    across.append(WordSlot(
-                        x=x, y=y, length=length, direction='across',
-                        number=num, word=word, clue=clue
-                    ))
-            
-            # Extract down words
-            if y == 0 or self.grid[y-1][x] == '.':
-                length = 0
-                while y + length < self.height and self.grid[y+length][x] != '.':
-                    length += 1
-                if length > 1:  # Only words of 2+ letters
-                    word = ''.join(self.grid[y+i][x] for i in range(length))
-                    clue_data = dict_helper.get_clue_for_word(word)
-                    clue = clue_data.get('clue', f"Definition related to {word}")
-                    down.append(WordSlot(
-                        x=x, y=y, length=length, direction='down',
-                        number=num, word=word, clue=clue
-                    ))
+        # Resolve every clue with one dictionary call
+        clues = dict_helper.get_clues_for_words(slot.word for slot in across + down)
+        for slot in across + down:
+            slot.clue = clues[slot.word].get('clue', f"Definition related to {slot.word}")
         
         return across, down
     
@@ -467,10 +585,10 @@ class CrosswordGenerator:
         across_slots, down_slots = self.analyze_grid()
         
         def format_slot(slot):
-            clue_data = dict_helper.get_clue_for_word(slot.word)
+            # Clues were resolved by analyze_grid
             return {
                 "number": slot.number,
-                "clue": clue_data['clue'],
+                "clue": slot.clue,
                 "answer": slot.word,
                 "x": slot.x,
                 "y": slot.y,
@@ -484,31 +602,13 @@ class CrosswordGenerator:
     
     def calculate_density(self):
         """Calculate the fill percentage of the grid"""
-        filled = 0
-        for row in self.grid:
-            filled += sum(1 for cell in row if cell != '.')
+        filled = int(np.count_nonzero(self.grid != EMPTY))
         return filled / (self.width * self.height)
 
     def get_intersection_points(self):
         """Find all points where words intersect (cross each other)"""
-        intersections = []
-        for y in range(self.height):
-            for x in range(self.width):
-                if self.grid[y][x] != '.':
-                    horizontal = False
-                    vertical = False
-                    
-                    # Check if part of horizontal word
-                    if (x > 0 and self.grid[y][x-1] != '.') or \
-                       (x < self.width-1 and self.grid[y][x+1] != '.'):
-                        horizontal = True
-                    
-                    # Check if part of vertical word
-                    if (y > 0 and self.grid[y-1][x] != '.') or \
-                       (y < self.height-1 and self.grid[y+1][x] != '.'):
-                        vertical = True
-                    
-                    # Intersection if part of both horizontal and vertical words
-                    if horizontal and vertical:
-                        intersections.append(Point(x, y))
-        return intersections
\ No newline at end of file
+        filled = self.grid != EMPTY
+        has_left, has_right, has_up, has_down = self._filled_neighbours(filled)
+        # Intersection if part of both horizontal and vertical words
+        ys, xs = np.nonzero(filled & (has_left | has_right) & (has_up | has_down))
+        return [Point(x, y) for y, x in zip(ys.tolist(), xs.tolist())]
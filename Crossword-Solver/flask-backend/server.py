@@ -284,7 +284,7 @@ def generate():
                           f"(target: {min_density:.2%}-{max_density:.2%})")
 
         if final_puzzle:
-            empty_grid = final_puzzle.empty_grid
+            empty_grid = final_puzzle.as_char_grid(final_puzzle.empty_grid)
             
             across, down = final_puzzle.analyze_grid(for_empty_grid=True)
             numbered_positions = {(slot.x, slot.y): slot.number for slot in across + down}
@@ -296,7 +296,7 @@ def generate():
             
             return _corsify_actual_response(jsonify({
                 "success": True,
-                "grid": final_puzzle.grid,
+                "grid": final_puzzle.as_char_grid(),
                 "empty_grid": empty_grid,   
                 "clues": final_puzzle.get_clues(),
                 "stats": {
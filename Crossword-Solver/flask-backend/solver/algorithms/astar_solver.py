@@ -1,23 +1,22 @@
-from typing import List, Dict, Set, Tuple
+from typing import List, Dict, Optional, Tuple
 import heapq
 import copy
+import random
 from collections import deque
 from ..core.base_solver import BaseCrosswordSolver
 
 class AStarState:
-    def __init__(self, grid: List[List[str]], filled_slots: Set[Tuple[int, str]], cost: int, slot_index: int):
-        self.grid = grid
-        self.filled_slots = filled_slots
+    # States keep only the cells their word changed, as (x, y, old, new), plus a link to
+    # the parent; the solver moves one shared grid between states along those links.
+    def __init__(self, parent: Optional['AStarState'], changes: List[Tuple[int, int, str, str]],
+                 cost: int, slot_index: int, grid_hash: int):
+        self.parent = parent
+        self.changes = changes
         self.cost = cost
         self.slot_index = slot_index
         self.heuristic = 0
         self.priority = 0
-        self.grid_hash = self.compute_hash()
-    
-    def compute_hash(self) -> str:
-        grid_str = ''.join(''.join(row) for row in self.grid)
-        slots_str = ','.join(sorted(f"{num}{dir}" for num, dir in self.filled_slots))
-        return f"{grid_str}|{slots_str}|{self.slot_index}"
+        self.grid_hash = grid_hash
     
     def __lt__(self, other):
         return self.priority < other.priority
@@ -27,7 +26,18 @@ class AStarSolver(BaseCrosswordSolver):
     def __init__(self, grid: List[List[str]], clues: Dict[str, List[Dict]], dict_helper, enable_memory_profiling: bool = False):
         super().__init__(grid, clues, enable_memory_profiling)
         self.setup_slots(dict_helper)
-        self.state_cache = {}
+        
+        # Certainty is fixed once slots are set up, so the heuristic's
+        # per-slot penalty is summed once from each index to the end.
+        self._certainty_penalty = [0] * (len(self.slots) + 1)
+        for i in range(len(self.slots) - 1, -1, -1):
+            certainty = self.slot_certainty.get(self.slots[i]['key'], 0)
+            self._certainty_penalty[i] = self._certainty_penalty[i + 1] + (3 - certainty) * 3
+        # Zobrist keys come from a private generator so hashing never
+        # perturbs the global random stream used for candidate tie-breaks.
+        self._zobrist_rng = random.Random(0)
+        self._zobrist = {}
+        self._depth_keys = [self._zobrist_rng.getrandbits(64) for _ in range(len(self.slots) + 1)]
         
     def solve(self) -> Dict:
         self._start_performance_tracking()
@@ -37,12 +47,15 @@ class AStarSolver(BaseCrosswordSolver):
         
         order = self.slot_ordering
         
+        self.grid = copy.deepcopy(self.solution)
         initial = AStarState(
-            grid=copy.deepcopy(self.solution),
-            filled_slots=set(),
+            parent=None,
+            changes=[],
             cost=0,
-            slot_index=0
+            slot_index=0,
+            grid_hash=self.hash_grid(self.grid)
         )
+        self.grid_state = initial
         initial.heuristic = self.calc_heuristic(initial)
         initial.priority = initial.cost + initial.heuristic
         
@@ -67,39 +80,42 @@ class AStarSolver(BaseCrosswordSolver):
             current = heapq.heappop(open_set)
             
             if current.slot_index >= len(order):
-                self.solution = current.grid
+                self.move_grid_to(current)
+                self.solution = self.grid
                 return self._create_result(True, len(self.slots), len(self.slots))
             
-            if current.grid_hash in closed_set:
+            state_key = self.state_key(current)
+            if state_key in closed_set:
                 continue
             
-            closed_set.add(current.grid_hash)
-            closed_set_deque.append(current.grid_hash)
+            closed_set.add(state_key)
+            closed_set_deque.append(state_key)
             
+            self.move_grid_to(current)
             slot = order[current.slot_index]
-            candidates = self.get_candidates(slot, current.grid)
+            candidates = self.get_candidates(slot, self.grid)
             
             for word, score in candidates:
-                new_grid = self.place_word(current.grid, slot, word)
-                new_filled = current.filled_slots | {(slot['number'], slot['direction'])}
-                
+                changes, new_hash = self.place_word(self.grid, slot, word, current.grid_hash)
                 new_state = AStarState(
-                    grid=new_grid,
-                    filled_slots=new_filled,
+                    parent=current,
+                    changes=changes,
                     cost=current.cost + 1,
-                    slot_index=current.slot_index + 1
+                    slot_index=current.slot_index + 1,
+                    grid_hash=new_hash
                 )
                 new_state.heuristic = self.calc_heuristic(new_state)
                 new_state.priority = new_state.cost + new_state.heuristic
                 
-                if new_state.grid_hash not in closed_set:
+                if self.state_key(new_state) not in closed_set:
                     heapq.heappush(open_set, new_state)
             
             self.complexity_tracker.increment_operations()
         
         if open_set:
             best = min(open_set, key=lambda s: (s.heuristic, -s.slot_index))
-            self.solution = best.grid
+            self.move_grid_to(best)
+            self.solution = self.grid
             filled = self.count_filled_words()
             return self._create_result(False, filled, len(self.slots))
         
@@ -131,20 +147,56 @@ class AStarSolver(BaseCrosswordSolver):
     def calc_heuristic(self, state: AStarState) -> int:
         remaining_slots = len(self.slots) - state.slot_index
         base_cost = remaining_slots * 5
-        
-        certainty_penalty = 0
-        for i in range(state.slot_index, len(self.slots)):
-            slot = self.slots[i]
-            certainty = self.slot_certainty.get((slot['number'], slot['direction']), 0)
-            certainty_penalty += (3 - certainty) * 3
-        
-        return base_cost + certainty_penalty
+        return base_cost + self._certainty_penalty[state.slot_index]
+    
+    def zobrist_key(self, x: int, y: int, char: str) -> int:
+        key = (x, y, char)
+        bits = self._zobrist.get(key)
+        if bits is None:
+            bits = self._zobrist[key] = self._zobrist_rng.getrandbits(64)
+        return bits
+    
+    def hash_grid(self, grid: List[List[str]]) -> int:
+        grid_hash = 0
+        for y, row in enumerate(grid):
+            for x, cell in enumerate(row):
+                grid_hash ^= self.zobrist_key(x, y, cell)
+        return grid_hash
+    
+    def state_key(self, state: AStarState) -> int:
+        # Slots are filled in a fixed order, so slot_index also pins down which slots are filled.
+        return state.grid_hash ^ self._depth_keys[state.slot_index]
+    
+    def place_word(self, grid: List[List[str]], slot: Dict, word: str, grid_hash: int) -> Tuple[List[Tuple[int, int, str, str]], int]:
+        # Leaves grid untouched: returns the cell changes placing word would make and the resulting hash.
+        changes = []
+        for (x, y), char in zip(slot['cells'], word):
+            old = grid[y][x]
+            if old != char:
+                grid_hash ^= self.zobrist_key(x, y, old) ^ self.zobrist_key(x, y, char)
+                changes.append((x, y, old, char))
+        return changes, grid_hash
+    
+    def move_grid_to(self, target: AStarState):
+        # Undo changes up to the common ancestor of the current and target states, then replay down.
+        current = self.grid_state
+        replay = []
+        while current.slot_index > target.slot_index:
+            self.revert_changes(current.changes)
+            current = current.parent
+        while target.slot_index > current.slot_index:
+            replay.append(target)
+            target = target.parent
+        while current is not target:
+            self.revert_changes(current.changes)
+            current = current.parent
+            replay.append(target)
+            target = target.parent
+        for state in reversed(replay):
+            for x, y, old, new in state.changes:
+                self.grid[y][x] = new
+        self.grid_state = replay[0] if replay else current
     
-    def place_word(self, grid: List[List[str]], slot: Dict, word: str) -> List[List[str]]:
-        new_grid = [row[:] for row in grid]
-        for i, char in enumerate(word):
-            if slot['direction'] == 'across':
-                new_grid[slot['y']][slot['x'] + i] = char
-            else:
-                new_grid[slot['y'] + i][slot['x']] = char
-        return new_grid
\ No newline at end of file
+    def revert_changes(self, changes: List[Tuple[int, int, str, str]]):
+        for x, y, old, new in changes:
+            self.grid[y][x] = old
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 from ..core.base_solver import BaseCrosswordSolver
 
 class DFSSolver(BaseCrosswordSolver):
@@ -18,7 +18,7 @@ class DFSSolver(BaseCrosswordSolver):
             return self._create_result(False, 0, len(self.slots))
 
         self.slot_candidates.sort(key=lambda x: (
-            -self.slot_certainty.get((x[0]['number'], x[0]['direction']), 0),
+            -self.slot_certainty.get(x[0]['key'], 0),
             len(x[1])
         ))
 
@@ -34,59 +34,101 @@ class DFSSolver(BaseCrosswordSolver):
             candidates.append((slot, slot_candidates))
         return candidates
 
+    def build_domains(self):
+        # Domains are bitsets over each slot's candidate list; letter_masks[i][pos][char]
+        # selects the candidates of slot i with char at pos.
+        index_by_key = {slot['key']: i for i, (slot, _) in enumerate(self.slot_candidates)}
+        self.domains = []
+        self.letter_masks = []
+        self.slot_crossings = []
+        for slot, candidates in self.slot_candidates:
+            domain = 0
+            masks = [{} for _ in range(slot['length'])]
+            for bit, word in enumerate(candidates):
+                if self.validate_placement(slot, word, self.solution):
+                    domain |= 1 << bit
+                for pos, char in enumerate(word):
+                    masks[pos][char] = masks[pos].get(char, 0) | 1 << bit
+            self.domains.append(domain)
+            self.letter_masks.append(masks)
+            self.slot_crossings.append([
+                (index_by_key[other_key], pos, other_pos)
+                for other_key, pos, other_pos in self.crossings.get(slot['key'], ())
+                if other_key in index_by_key
+            ])
+        # pruned_by[j] lists the assigned slots that narrowed domain j, in assignment order
+        self.pruned_by = [[] for _ in self.slot_candidates]
+        self.conflict_sets = [set() for _ in self.slot_candidates]
+
     def dfs(self, slot_idx: int) -> bool:
+        self.build_domains()
+        return self.search(slot_idx) is None
+
+    def search(self, slot_idx: int) -> Optional[int]:
+        """Fill slots from slot_idx on; returns None when solved, otherwise the slot index
+        to backjump to (-1 when no earlier assignment is to blame)."""
         if slot_idx >= len(self.slot_candidates):
-            return True
+            return None
 
         slot, candidates = self.slot_candidates[slot_idx]
+        conflicts = self.conflict_sets[slot_idx]
+        conflicts.clear()
 
-        if not candidates:
-            return False
-
-        for word in candidates:
-            if not self.validate_placement(slot, word, self.solution):
+        for bit, word in enumerate(candidates):
+            if not self.domains[slot_idx] >> bit & 1:
                 continue
 
             positions = self.place_word(slot, word)
+            trail, wiped_out = self.forward_check(slot_idx, word)
 
-            if not self.check_future_constraints(slot_idx + 1):
-                self.remove_word(positions)
-                continue
-
-            if self.dfs(slot_idx + 1):
-                return True
+            if wiped_out is None:
+                jump = self.search(slot_idx + 1)
+                if jump is None:
+                    return None
+            else:
+                conflicts.update(self.pruned_by[wiped_out])
+                jump = slot_idx
 
+            self.undo_forward_check(slot_idx, trail)
             self.remove_word(positions)
 
-        return False
+            if jump != slot_idx:
+                return jump
 
-    def check_future_constraints(self, start_idx: int) -> bool:
-        lookahead = min(3, len(self.slot_candidates) - start_idx)
-        
-        for i in range(start_idx, start_idx + lookahead):
-            if i >= len(self.slot_candidates):
+        conflicts.update(self.pruned_by[slot_idx])
+        conflicts.discard(slot_idx)
+        if not conflicts:
+            return -1
+
+        target = max(conflicts)
+        conflicts.discard(target)
+        self.conflict_sets[target].update(conflicts)
+        return target
+
+    def forward_check(self, slot_idx: int, word: str) -> Tuple[List[Tuple[int, int]], Optional[int]]:
+        trail = []
+        for other_idx, pos, other_pos in self.slot_crossings[slot_idx]:
+            if other_idx <= slot_idx:
                 continue
-                
-            slot, _ = self.slot_candidates[i]
-            has_valid = False
-            for candidate_word in self.slot_candidates[i][1]:
-                if self.validate_placement(slot, candidate_word, self.solution):
-                    has_valid = True
-                    break
-            
-            if not has_valid:
-                return False
-        
-        return True
+            domain = self.domains[other_idx]
+            narrowed = domain & self.letter_masks[other_idx][other_pos].get(word[pos], 0)
+            if narrowed == domain:
+                continue
+            trail.append((other_idx, domain))
+            self.domains[other_idx] = narrowed
+            self.pruned_by[other_idx].append(slot_idx)
+            if not narrowed:
+                return trail, other_idx
+        return trail, None
+
+    def undo_forward_check(self, slot_idx: int, trail: List[Tuple[int, int]]):
+        for other_idx, domain in reversed(trail):
+            self.domains[other_idx] = domain
+            self.pruned_by[other_idx].pop()
 
     def place_word(self, slot: Dict, word: str) -> List[Tuple[int, int]]:
             positions = []
-            for i, char in enumerate(word):
-                if slot['direction'] == 'across':
-                    x, y = slot['x'] + i, slot['y']
-                else:
-                    x, y = slot['x'], slot['y'] + i
-
+            for (x, y), char in zip(slot['cells'], word):
                 if self.solution[y][x] == '.':
                     self.solution[y][x] = char
                     positions.append((x, y))
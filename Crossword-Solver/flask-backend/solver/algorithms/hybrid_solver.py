@@ -108,7 +108,7 @@ class HybridSolver(BaseCrosswordSolver):
             self._record_memory_snapshot("dfs_start")
         
         remaining = [slot for slot in order 
-                    if (slot['number'], slot['direction']) not in initial_filled]
+                    if slot['key'] not in initial_filled]
         
         if not remaining:
             return True
@@ -131,12 +131,7 @@ class HybridSolver(BaseCrosswordSolver):
                 continue
             
             positions = []
-            for i, char in enumerate(word):
-                if slot['direction'] == 'across':
-                    x, y = slot['x'] + i, slot['y']
-                else:
-                    x, y = slot['x'], slot['y'] + i
-                
+            for (x, y), char in zip(slot['cells'], word):
                 if self.solution[y][x] == '.':
                     self.solution[y][x] = char
                     positions.append((x, y))
@@ -178,7 +173,7 @@ class HybridSolver(BaseCrosswordSolver):
                 continue
 
             new_grid = self.place_word(state.grid, slot, word)
-            new_filled = state.filled_slots | {(slot['number'], slot['direction'])}
+            new_filled = state.filled_slots | {slot['key']}
             
             new_state = SolverState(
                 grid=new_grid,
@@ -197,11 +192,8 @@ class HybridSolver(BaseCrosswordSolver):
 
     def place_word(self, grid: List[List[str]], slot: Dict, word: str) -> List[List[str]]:
         new_grid = [row[:] for row in grid]
-        for i, char in enumerate(word):
-            if slot['direction'] == 'across':
-                new_grid[slot['y']][slot['x'] + i] = char
-            else:
-                new_grid[slot['y'] + i][slot['x']] = char
+        for (x, y), char in zip(slot['cells'], word):
+            new_grid[y][x] = char
         return new_grid
 
     def estimate_difficulty(self, state: SolverState) -> int:
@@ -214,8 +206,7 @@ class HybridSolver(BaseCrosswordSolver):
         
         for i in range(state.slot_index, min(state.slot_index + 3, len(state.processing_order))):
             slot = state.processing_order[i]
-            slot_key = (slot['number'], slot['direction'])
-            constraint_degree = len(self.slot_graph.get(slot_key, []))
+            constraint_degree = len(self.slot_graph.get(slot['key'], []))
             heuristic += constraint_degree * 2
         
         return heuristic
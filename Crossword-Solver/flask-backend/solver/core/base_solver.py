@@ -41,6 +41,7 @@ class BaseCrosswordSolver(ABC):
         self.slot_manager = SlotManager(self.solution, self.clues)
         self.slots = self.slot_manager.get_word_slots()
         self.slot_graph = self.slot_manager.build_slot_graph(self.slots)
+        self.crossings = self.slot_manager.build_crossings(self.slots)
         self.constraint_checker = ConstraintChecker(self.solution, self.slot_graph)
         self.slot_certainty = {}
         self.analyze_certainty()
@@ -61,14 +62,14 @@ class BaseCrosswordSolver(ABC):
                 pattern_words = self.dict_helper.get_words_by_pattern(pattern, None, 10)
                 certainty = 1 if pattern_words else 0
                 
-            self.slot_certainty[(slot['number'], slot['direction'])] = certainty
+            self.slot_certainty[slot['key']] = certainty
 
     def get_certainty_ordering(self) -> List[Dict]:
         certain = []
         uncertain = []
         
         for slot in self.slots:
-            certainty = self.slot_certainty[(slot['number'], slot['direction'])]
+            certainty = self.slot_certainty[slot['key']]
             if certainty >= 2:
                 certain.append(slot)
             else:
@@ -80,38 +81,32 @@ class BaseCrosswordSolver(ABC):
     def get_slot_pattern(self, slot: Dict, grid=None) -> str:
         if grid is None:
             grid = self.solution
-        pattern = []
-        for i in range(slot['length']):
-            if slot['direction'] == 'across':
-                x, y = slot['x'] + i, slot['y']
-            else:
-                x, y = slot['x'], slot['y'] + i
-            pattern.append(grid[y][x] if grid[y][x] != '.' else '.')
-        return ''.join(pattern)
+        if slot['direction'] == 'across':
+            # Across cells are contiguous in their row, so the pattern is one slice.
+            x = slot['x']
+            return ''.join(grid[slot['y']][x:x + slot['length']])
+        return ''.join([grid[y][x] for x, y in slot['cells']])
 
     def get_clue_candidates(self, slot: Dict) -> List[Dict]:
         return self.dict_helper.get_words_for_crossword_slot(
             slot['clue'], slot['length'], max_words=200
         )
 
-    def get_pattern_candidates(self, slot: Dict, grid: List[List[str]]) -> List[Dict]:
-        pattern = self.get_slot_pattern(slot, grid)
-        return self.dict_helper.get_words_by_pattern(pattern, None, 50)
+    def slot_in_bounds(self, slot: Dict, grid: List[List[str]]) -> bool:
+        cells = slot['cells']
+        if not cells:
+            return True
+        # Slots are straight lines, so checking both ends bounds every cell.
+        (x0, y0), (x1, y1) = cells[0], cells[-1]
+        return 0 <= y0 and y1 < len(grid) and 0 <= x0 and x1 < len(grid[0])
 
     def validate_placement(self, slot: Dict, word: str, grid: List[List[str]]) -> bool:
-        if len(word) != slot['length']:
+        if len(word) != slot['length'] or not self.slot_in_bounds(slot, grid):
             return False
         
-        for i, char in enumerate(word):
-            if slot['direction'] == 'across':
-                x, y = slot['x'] + i, slot['y']
-            else:
-                x, y = slot['x'], slot['y'] + i
-            
-            if not (0 <= y < len(grid) and 0 <= x < len(grid[0])):
-                return False
-            
-            if grid[y][x] != '.' and grid[y][x] != char:
+        for (x, y), char in zip(slot['cells'], word):
+            cell = grid[y][x]
+            if cell != '.' and cell != char:
                 return False
         
         return True
@@ -124,12 +119,7 @@ class BaseCrosswordSolver(ABC):
             score += 100
         
         grid_compat = 0
-        for i, char in enumerate(word):
-            if slot['direction'] == 'across':
-                x, y = slot['x'] + i, slot['y']
-            else:
-                x, y = slot['x'], slot['y'] + i
-            
+        for (x, y), char in zip(slot['cells'], word):
             if grid[y][x] != '.' and grid[y][x] == char:
                 grid_compat += 5
         score += grid_compat
@@ -161,12 +151,21 @@ class BaseCrosswordSolver(ABC):
             return scored[:3]
 
     def get_pattern_fallback(self, slot: Dict, grid: List[List[str]]) -> List[Tuple[str, int]]:
-        pattern_candidates = self.get_pattern_candidates(slot, grid)
+        pattern = self.get_slot_pattern(slot, grid)
+        pattern_candidates = self.dict_helper.get_words_by_pattern(pattern, None, 50)
+        
+        # The pattern query has already matched every filled cell, so unless lowercase
+        # cells made it case-blind only the length and bounds checks are left.
+        prechecked = pattern == pattern.upper() and self.slot_in_bounds(slot, grid)
         
         fitting = []
         for candidate in pattern_candidates:
             word = candidate['word'].upper()
-            if self.validate_placement(slot, word, grid):
+            if prechecked:
+                fits = len(word) == slot['length']
+            else:
+                fits = self.validate_placement(slot, word, grid)
+            if fits:
                 score = candidate.get('score', 0) // 20
                 fitting.append((word, score))
         
@@ -176,16 +175,7 @@ class BaseCrosswordSolver(ABC):
     def count_filled_words(self) -> int:
         filled = 0
         for slot in self.slots:
-            is_filled = True
-            for i in range(slot['length']):
-                if slot['direction'] == 'across':
-                    x, y = slot['x'] + i, slot['y']
-                else:
-                    x, y = slot['x'], slot['y'] + i
-                if self.solution[y][x] == '.':
-                    is_filled = False
-                    break
-            if is_filled:
+            if all(self.solution[y][x] != '.' for x, y in slot['cells']):
                 filled += 1
         return filled
         
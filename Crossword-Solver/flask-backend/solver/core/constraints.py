@@ -19,17 +19,13 @@ class ConstraintChecker:
         return True
         
     def check_perpendicular_constraints(self, slot: Dict, word: str, slots: List[Dict]) -> bool:
-        slot_key = (slot['number'], slot['direction'])
+        slot_key = slot['key']
         
         if slot_key not in self.slot_graph:
             return True
             
         for other_slot_key in self.slot_graph[slot_key]:
-            other_slot = next(
-                (s for s in slots 
-                 if s['number'] == other_slot_key[0] and s['direction'] == other_slot_key[1]),
-                None
-            )
+            other_slot = next((s for s in slots if s['key'] == other_slot_key), None)
             if not other_slot:
                 continue
                 
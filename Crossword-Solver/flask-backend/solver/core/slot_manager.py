@@ -24,7 +24,9 @@ class SlotManager:
             slots.append({
                 'number': clue['number'],
                 'direction': 'across',
+                'key': (clue['number'], 'across'),
                 'x': x, 'y': y, 'length': length,
+                'cells': tuple((x + i, y) for i in range(length)),
                 'clue': clue['clue'],
                 'answer': clue.get('answer', '')
             })
@@ -40,7 +42,9 @@ class SlotManager:
             slots.append({
                 'number': clue['number'],
                 'direction': 'down',
+                'key': (clue['number'], 'down'),
                 'x': x, 'y': y, 'length': length,
+                'cells': tuple((x, y + i) for i in range(length)),
                 'clue': clue['clue'],
                 'answer': clue.get('answer', '')
             })
@@ -52,14 +56,8 @@ class SlotManager:
         graph = defaultdict(set)
         
         for slot in slots:
-            for i in range(slot['length']):
-                if slot['direction'] == 'across':
-                    pos = (slot['x'] + i, slot['y'])
-                else:
-                    pos = (slot['x'], slot['y'] + i)
-                
-                key = (slot['number'], slot['direction'])
-                
+            key = slot['key']
+            for pos in slot['cells']:
                 if pos not in position_map:
                     position_map[pos] = []
                 position_map[pos].append(key)
@@ -72,4 +70,19 @@ class SlotManager:
                             graph[slot1].add(slot2)
                             graph[slot2].add(slot1)
         
-        return graph
\ No newline at end of file
+        return graph
+
+    def build_crossings(self, slots: List[Dict]) -> Dict[Tuple[int, str], List[Tuple[Tuple[int, str], int, int]]]:
+        cell_to_slots = defaultdict(list)
+        for slot in slots:
+            for offset, pos in enumerate(slot['cells']):
+                cell_to_slots[pos].append((slot['key'], offset))
+        
+        crossings = {slot['key']: [] for slot in slots}
+        for entries in cell_to_slots.values():
+            for key, offset in entries:
+                for other_key, other_offset in entries:
+                    if other_key != key:
+                        crossings[key].append((other_key, offset, other_offset))
+        
+        return crossings
\ No newline at end of file
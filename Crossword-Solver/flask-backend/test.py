@@ -41,7 +41,7 @@ class DictionarySearcher:
     
     def search_by_pattern(self):
         print("\n=== SEARCH BY PATTERN ===")
-        print("Use letters for known positions, '.' for unknown")
+        print("Use letters for known positions, '.' for unknown, '[AEI]' for any of several letters")
         print("Example: 'A..LE' for a 5-letter word starting with A and ending with LE")
         
         pattern = input("Enter pattern: ").strip().upper()
@@ -49,8 +49,8 @@ class DictionarySearcher:
             print("No pattern entered.")
             return
             
-        if not all(c in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ.' for c in pattern):
-            print("Invalid pattern. Use only letters and dots.")
+        if not all(c in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ.[]' for c in pattern):
+            print("Invalid pattern. Use only letters, dots and brackets.")
             return
             
         clue = input("Optional clue/keyword (press Enter to skip): ").strip()
@@ -97,8 +97,39 @@ class DictionarySearcher:
         print(f"Length: {len(word_data['word'])}")
         print(f"Score: {word_data['score']}")
         print(f"Clue: {word_data['clue']}")
-        if 'definition' in word_data:
-            print(f"Definition: {word_data['definition']}")
+        definition = self.dictionary.get_definition(word)
+        if definition:
+            print(f"Definition: {definition}")
+    
+    def check_pattern_queries(self):
+        print("\n=== PATTERN QUERY CHECKS ===")
+        max_words = 1000
+        
+        # Patterns are uppercased on entry, so lowercase letters and classes match like uppercase ones
+        upper = self.dictionary.get_words_by_pattern('A..LE', max_words=max_words)
+        assert upper, "expected words for 'A..LE'"
+        assert self.dictionary.get_words_by_pattern('a..le', max_words=max_words) == upper
+        assert (self.dictionary.get_words_by_pattern('b[aeiou]t', max_words=max_words)
+                == self.dictionary.get_words_by_pattern('B[AEIOU]T', max_words=max_words))
+        
+        # A letter class matches exactly the words of its single-letter patterns
+        for pattern, letters in (('B[AEIOU]T', 'AEIOU'), ('[CM]A.E', 'CM'), ('.[AO][RN]E.', None)):
+            words = [word_data['word'] for word_data in self.dictionary.get_words_by_pattern(pattern, max_words=max_words)]
+            assert words, f"expected words for '{pattern}'"
+            if letters:
+                expected = set()
+                for letter in letters:
+                    single = pattern.replace(f"[{letters}]", letter)
+                    expected.update(word_data['word'] for word_data in self.dictionary.get_words_by_pattern(single, max_words=max_words))
+                assert set(words) == expected, pattern
+            else:
+                assert all(word[1] in 'AO' and word[2] in 'RN' for word in words), pattern
+        
+        # Anything outside letters, '.' and classes is matched literally, so it finds nothing
+        for pattern in ('A[..', 'A+.', '(A).', 'B[]T', 'B[A-E]T'):
+            assert self.dictionary.get_words_by_pattern(pattern, max_words=max_words) == [], pattern
+        
+        print("All pattern checks passed.")
     
     def show_menu(self):
         print("\n" + "="*50)
@@ -115,7 +146,7 @@ class DictionarySearcher:
     
     def run(self):
         print("Initializing dictionary...")
-        print(f"Total words loaded: {len(self.dictionary.all_words)}")
+        print(f"Total words loaded: {len(self.dictionary.store)}")
         
         while True:
             self.show_menu()
@@ -160,7 +191,11 @@ def main():
             return
     
     searcher = DictionarySearcher(dictionary_path)
-    searcher.run()
+    # "python test.py --check" runs the pattern query checks instead of the interactive menu
+    if '--check' in sys.argv[1:]:
+        searcher.check_pattern_queries()
+    else:
+        searcher.run()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file